@@ -9,26 +9,34 @@ Supports direct info hash input or interactive torrent selection.
 from __future__ import annotations
 
 import argparse
+import atexit
 import logging
 import os
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from urllib.parse import urlparse
 
-import qbittorrentapi
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.logging import RichHandler
-from textual import on
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import Container
-from textual.widgets import Button, DataTable, Footer, Header, Input, Static
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
 
 if TYPE_CHECKING:
-    pass
+    import qbittorrentapi
 
 # Load environment variables
 load_dotenv()
@@ -52,15 +60,27 @@ def setup_logging() -> logging.Logger:
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "cross-seed.log"
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-            RichHandler(console=console, rich_tracebacks=True, show_path=False),
-        ],
+    # Route records through a queue so the webhook worker threads only
+    # enqueue; the listener thread does the formatting and file flushes
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
     )
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        file_handler,
+        RichHandler(console=console, rich_tracebacks=True, show_path=False),
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Attach the queue handler directly; basicConfig would install its default
+    # formatter on it and prepare() would bake that into every record before
+    # the listener's handlers format it again
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
 
     logger = logging.getLogger(__name__)
     logger.info(f"Logging to: {log_file}")
@@ -88,6 +108,8 @@ def get_config() -> dict:
 
 def connect_qbittorrent(config: dict) -> qbittorrentapi.Client:
     """Connect to qBittorrent WebUI."""
+    import qbittorrentapi
+
     try:
         client = qbittorrentapi.Client(
             host=config["qbit_host"],
@@ -105,7 +127,30 @@ def connect_qbittorrent(config: dict) -> qbittorrentapi.Client:
         sys.exit(1)
 
 
+def make_session(pool_size: int) -> requests.Session:
+    """Create a pooled HTTP session with retries for webhook calls.
+
+    Retries cover connection errors and transient gateway failures (502/503/504)
+    so a blip doesn't immediately fail the hash; POST is not retried by default
+    so it has to be allowed explicitly.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=2,
+        pool_maxsize=max(16, pool_size),
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+        ),
+    )
+    session.mount("http://", adapter)
+    return session
+
+
 def trigger_cross_seed(
+    session: requests.Session,
     config: dict,
     info_hash: str,
     logger: logging.Logger,
@@ -126,7 +171,7 @@ def trigger_cross_seed(
     }
 
     try:
-        response = requests.post(url, params=params, data=data, timeout=30)
+        response = session.post(url, params=params, data=data, timeout=5)
         response.raise_for_status()
         logger.info(f"Successfully triggered cross-seed for: {info_hash}")
         return True
@@ -135,394 +180,521 @@ def trigger_cross_seed(
         return False
 
 
-def get_torrents(client: qbittorrentapi.Client) -> list:
-    """Get all torrents from qBittorrent, sorted by name.
+def _format_size(size: int) -> str:
+    """Format a size in bytes for the Size column.
 
-    Excludes torrents with 'cross-seed-link' category as they are already cross-seeded.
+    Integer right-shift to MiB avoids float division for the common path, and
+    sub-GB torrents get a MB figure instead of rounding down to 0.00 GB.
     """
-    torrents = client.torrents_info()
-    # Filter out cross-seeded torrents
-    torrents = [t for t in torrents if t.category != "cross-seed-link"]
-    return sorted(torrents, key=lambda t: t.name.lower())
+    size_mb = size >> 20
+    if size_mb >= 1024:
+        return f"{size_mb / 1024:.2f} GB"
+    return f"{size_mb} MB"
 
 
-class TorrentSelectorApp(App):
-    """A Textual app to select torrents for cross-seeding."""
-
-    TITLE = "qBittorrent Cross-Seed"
-    SHOW_CLOCK = False
-
-    CSS = """
-    Screen {
-        background: #1a1a1a;
-    }
-
-    Header {
-        background: #2d2d2d;
-        color: #e0e0e0;
-    }
-
-    HeaderIcon {
-        display: none;
-    }
-
-    Footer {
-        background: #2d2d2d;
-        color: #808080;
-    }
-
-    Footer > .footer--key {
-        background: #404040;
-        color: #4eb5ab;
-    }
+@lru_cache(maxsize=256)
+def _tracker_host(url: str) -> str:
+    """Extract the hostname from a tracker URL.
 
-    Scrollbar {
-        background: #2d2d2d;
-    }
+    Memoized because libraries typically share a handful of trackers across
+    many torrents, so each unique URL is only parsed once.
+    """
+    try:
+        return urlparse(url).hostname or url
+    except ValueError:
+        # Malformed URL (e.g. unbalanced bracket); fall back to the raw string
+        return url
 
-    ScrollbarSlider {
-        color: #4eb5ab;
-    }
 
-    #search-container {
-        height: auto;
-        padding: 0 1;
-        background: #2d2d2d;
-        layout: horizontal;
-    }
+class TorrentInfo(NamedTuple):
+    """The subset of torrent fields the selector actually uses."""
 
-    #search-label {
-        width: auto;
-        height: 1;
-        padding: 0 1;
-        color: #4eb5ab;
-        background: #2d2d2d;
-    }
+    hash: str
+    name: str
+    size: int
+    tracker: str
 
-    #search-input {
-        width: 1fr;
-        height: 1;
-        background: #2d2d2d;
-        border: none;
-        color: #e0e0e0;
-        padding: 0;
-    }
 
-    #search-input:focus {
-        background: #333333;
-    }
+class _Row(NamedTuple):
+    """Precomputed display/sort fields for one table row.
 
-    #search-input > .input--placeholder {
-        color: #606060;
-    }
+    A NamedTuple keeps the per-torrent cache at C-level tuple storage with no
+    __dict__, which matters at 10k+ torrents.
+    """
 
-    DataTable {
-        height: 100%;
-        background: #1a1a1a;
-    }
+    name: str
+    name_casefold: str
+    size_str: str
+    tracker_host: str
 
-    DataTable > .datatable--header {
-        background: #2d2d2d;
-        color: #808080;
-        text-style: bold;
-    }
 
-    DataTable > .datatable--cursor {
-        background: #4eb5ab;
-        color: #1a1a1a;
-    }
+def get_torrents(client: qbittorrentapi.Client) -> list[TorrentInfo]:
+    """Get all torrents from qBittorrent, sorted by name.
 
-    DataTable > .datatable--hover {
-        background: #333333;
-    }
+    Excludes torrents with 'cross-seed-link' category as they are already cross-seeded.
+    Requests plain dict responses to skip qbittorrentapi's per-torrent AttrDict
+    wrapping, then keeps only the fields the UI needs.
+    """
+    raw = client.torrents_info(SIMPLE_RESPONSES=True)
+    # Filter out cross-seeded torrents; decorate-sort-undecorate so each name
+    # is casefolded exactly once rather than N log N times in the comparator
+    keyed = [
+        (
+            t["name"].casefold(),
+            TorrentInfo(t["hash"], t["name"], t["size"], t.get("tracker", "")),
+        )
+        for t in raw
+        if t.get("category") != "cross-seed-link"
+    ]
+    keyed.sort(key=lambda kt: kt[0])
+    return [t for _, t in keyed]
 
-    DataTable > .datatable--even-row {
-        background: #1a1a1a;
-    }
 
-    DataTable > .datatable--odd-row {
-        background: #222222;
-    }
+@lru_cache(maxsize=None)
+def _selector_app_class() -> type:
+    """Build the Textual selector App class, importing Textual on first use.
 
-    #status-bar {
-        height: auto;
-        padding: 1 2;
-        background: #2d2d2d;
-        color: #808080;
-    }
+    Keeps the heavyweight textual imports off the -i info-hash fast path,
+    which only needs requests and rich.
+    """
+    from textual import on
+    from textual.app import App, ComposeResult
+    from textual.binding import Binding
+    from textual.containers import Container
+    from textual.widgets import Button, DataTable, Footer, Header, Input, Static
+
+    class TorrentSelectorApp(App):
+        """A Textual app to select torrents for cross-seeding."""
+
+        TITLE = "qBittorrent Cross-Seed"
+        SHOW_CLOCK = False
+
+        CSS = """
+        Screen {
+            background: #1a1a1a;
+        }
+
+        Header {
+            background: #2d2d2d;
+            color: #e0e0e0;
+        }
+
+        HeaderIcon {
+            display: none;
+        }
+
+        Footer {
+            background: #2d2d2d;
+            color: #808080;
+        }
+
+        Footer > .footer--key {
+            background: #404040;
+            color: #4eb5ab;
+        }
+
+        Scrollbar {
+            background: #2d2d2d;
+        }
+
+        ScrollbarSlider {
+            color: #4eb5ab;
+        }
+
+        #search-container {
+            height: auto;
+            padding: 0 1;
+            background: #2d2d2d;
+            layout: horizontal;
+        }
+
+        #search-label {
+            width: auto;
+            height: 1;
+            padding: 0 1;
+            color: #4eb5ab;
+            background: #2d2d2d;
+        }
+
+        #search-input {
+            width: 1fr;
+            height: 1;
+            background: #2d2d2d;
+            border: none;
+            color: #e0e0e0;
+            padding: 0;
+        }
+
+        #search-input:focus {
+            background: #333333;
+        }
+
+        #search-input > .input--placeholder {
+            color: #606060;
+        }
+
+        DataTable {
+            height: 100%;
+            background: #1a1a1a;
+        }
+
+        DataTable > .datatable--header {
+            background: #2d2d2d;
+            color: #808080;
+            text-style: bold;
+        }
+
+        DataTable > .datatable--cursor {
+            background: #4eb5ab;
+            color: #1a1a1a;
+        }
+
+        DataTable > .datatable--hover {
+            background: #333333;
+        }
+
+        DataTable > .datatable--even-row {
+            background: #1a1a1a;
+        }
+
+        DataTable > .datatable--odd-row {
+            background: #222222;
+        }
+
+        #status-bar {
+            height: auto;
+            padding: 1 2;
+            background: #2d2d2d;
+            color: #808080;
+        }
+
+        #button-container {
+            height: auto;
+            padding: 1 2;
+            background: #1a1a1a;
+            align: center middle;
+        }
+
+        Button {
+            margin: 0 1;
+            min-width: 20;
+        }
+
+        #confirm-btn {
+            background: #4eb5ab;
+            color: #1a1a1a;
+            border: none;
+        }
+
+        #confirm-btn:hover {
+            background: #5fcfc4;
+        }
+
+        #confirm-btn:focus {
+            text-style: bold;
+        }
+
+        #cancel-btn {
+            background: #404040;
+            color: #e0e0e0;
+            border: none;
+        }
+
+        #cancel-btn:hover {
+            background: #505050;
+        }
+        """
+
+        BINDINGS = [
+            Binding("q", "quit", "Quit"),
+            Binding("escape", "unfocus_search", "Back"),
+            Binding("space", "toggle_select", "Toggle Select", show=True),
+            Binding("enter", "confirm", "Confirm Selection", show=True, priority=True),
+            Binding("a", "select_all", "Select All"),
+            Binding("n", "select_none", "Select None"),
+            Binding("/", "focus_search", "Search"),
+            Binding("1", "sort_by_name", "Sort Name"),
+            Binding("2", "sort_by_size", "Sort Size"),
+            Binding("3", "sort_by_tracker", "Sort Tracker"),
+        ]
+
+        def __init__(
+            self,
+            torrents: list,
+            config: dict,
+            app_logger: logging.Logger,
+            include_single_episodes: bool,
+        ):
+            super().__init__()
+            self._torrents = torrents
+            # Indices into self._torrents for the current filter/sort view;
+            # cheaper to build and sort than copies of the torrent list
+            self._filtered_idx: list[int] = list(range(len(torrents)))
+            self._selected_hashes: set = set()
+            self._config = config
+            self._app_logger = app_logger
+            self._include_single_episodes = include_single_episodes
+            self._results: list = []
+            self._sort_column: str | None = None
+            self._sort_reverse: bool = False
+            self._filter_timer = None
+            self._last_query: str = ""
+            # Build a map of hash -> torrent for size lookups
+            self._torrent_map: dict = {t.hash: t for t in torrents}
+            # Hashes of the rows currently in the table, for delta updates
+            self._row_hashes: set = set()
+            # Precompute display/sort fields once so repopulating the table is
+            # pure string lookups -- no urlparse or float formatting per repaint
+            self._rows: dict[str, _Row] = {
+                t.hash: _Row(
+                    t.name,
+                    t.name.casefold(),
+                    _format_size(t.size),
+                    _tracker_host(t.tracker) if t.tracker else "-",
+                )
+                for t in torrents
+            }
+            # Casefolded names aligned with self._torrents for the filter scan
+            self._names_casefold: list[str] = [
+                self._rows[t.hash].name_casefold for t in torrents
+            ]
 
-    #button-container {
-        height: auto;
-        padding: 1 2;
-        background: #1a1a1a;
-        align: center middle;
-    }
+        def compose(self) -> ComposeResult:
+            yield Header()
+            yield Container(
+                Static("Filter: ", id="search-label"),
+                Input(placeholder="type to filter...", id="search-input"),
+                id="search-container",
+            )
+            yield DataTable(id="torrent-table", cursor_type="row")
+            yield Static(id="status-bar")
+            yield Container(
+                Button("Confirm Selection", id="confirm-btn", variant="primary"),
+                Button("Cancel", id="cancel-btn", variant="error"),
+                id="button-container",
+            )
+            yield Footer()
+
+        def on_mount(self) -> None:
+            """Set up the table when the app starts."""
+            table = self.query_one("#torrent-table", DataTable)
+            # Add sortable columns
+            table.add_column("Sel", key="sel")
+            table.add_column("Name", key="name")
+            table.add_column("Size", key="size")
+            table.add_column("Tracker", key="tracker")
+            self._sel_col_key = "sel"
+            self._populate_table()
+            self._update_status()
+            table.focus()
+
+        def _populate_table(self) -> None:
+            """Populate the table with filtered torrents."""
+            table = self.query_one("#torrent-table", DataTable)
+            table.clear()
+            self._row_hashes = {self._torrents[i].hash for i in self._filtered_idx}
+
+            for i in self._filtered_idx:
+                torrent = self._torrents[i]
+                selected = " * " if torrent.hash in self._selected_hashes else "   "
+                row = self._rows[torrent.hash]
+                table.add_row(
+                    selected,
+                    row.name,
+                    row.size_str,
+                    row.tracker_host,
+                    key=torrent.hash,
+                )
+
+        def _update_status(self) -> None:
+            """Update the status bar."""
+            status = self.query_one("#status-bar", Static)
+            total = len(self._torrents)
+            filtered = len(self._filtered_idx)
+            selected = len(self._selected_hashes)
+
+            if filtered < total:
+                status.update(
+                    f"Showing {filtered}/{total} torrents | {selected} selected"
+                )
+            else:
+                status.update(f"{total} torrents | {selected} selected")
+
+        @on(Input.Changed, "#search-input")
+        def filter_torrents(self, event: Input.Changed) -> None:
+            """Debounce filter keystrokes so rapid typing triggers one rebuild."""
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            value = event.value
+            self._filter_timer = self.set_timer(0.05, lambda: self._apply_filter(value))
+
+        def _apply_filter(self, value: str) -> None:
+            """Filter torrents based on search input."""
+            self._filter_timer = None
+            query = value.casefold().strip()
+            if query == self._last_query:
+                # Nothing changed (e.g. Escape clearing an already-empty
+                # search); the table already shows this view
+                return
+            self._last_query = query
+
+            if query:
+                self._filtered_idx = [
+                    i
+                    for i, name_casefold in enumerate(self._names_casefold)
+                    if query in name_casefold
+                ]
+            else:
+                self._filtered_idx = list(range(len(self._torrents)))
+
+            new_hashes = {self._torrents[i].hash for i in self._filtered_idx}
+            if new_hashes <= self._row_hashes:
+                # Narrowed filter: rows only disappear, so drop the delta in place
+                # instead of clearing and re-adding everything. Order is preserved.
+                table = self.query_one("#torrent-table", DataTable)
+                for hash_value in self._row_hashes - new_hashes:
+                    table.remove_row(hash_value)
+                self._row_hashes = new_hashes
+            else:
+                # Rows reappeared; DataTable can only append, so rebuild to keep
+                # the sort order intact.
+                self._populate_table()
+            self._update_status()
 
-    Button {
-        margin: 0 1;
-        min-width: 20;
-    }
+        def action_toggle_select(self) -> None:
+            """Toggle selection of the current row."""
+            table = self.query_one("#torrent-table", DataTable)
+            if table.row_count == 0:
+                return
 
-    #confirm-btn {
-        background: #4eb5ab;
-        color: #1a1a1a;
-        border: none;
-    }
+            row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
+            if row_key is not None:
+                self._toggle_hash(str(row_key.value))
 
-    #confirm-btn:hover {
-        background: #5fcfc4;
-    }
+        def _toggle_hash(self, hash_value: str) -> None:
+            """Toggle a hash in the selected set."""
+            if hash_value in self._selected_hashes:
+                self._selected_hashes.discard(hash_value)
+            else:
+                self._selected_hashes.add(hash_value)
 
-    #confirm-btn:focus {
-        text-style: bold;
-    }
+            # Update the checkbox in the table
+            table = self.query_one("#torrent-table", DataTable)
+            selected = " * " if hash_value in self._selected_hashes else "   "
+            table.update_cell(hash_value, self._sel_col_key, selected)
+            self._update_status()
 
-    #cancel-btn {
-        background: #404040;
-        color: #e0e0e0;
-        border: none;
-    }
+        def action_select_all(self) -> None:
+            """Select all visible torrents."""
+            self._selected_hashes.update(
+                self._torrents[i].hash for i in self._filtered_idx
+            )
+            table = self.query_one("#torrent-table", DataTable)
+            # Coalesce the per-cell refreshes into a single repaint
+            with self.batch_update():
+                for i in self._filtered_idx:
+                    table.update_cell(self._torrents[i].hash, self._sel_col_key, " * ")
+            self._update_status()
 
-    #cancel-btn:hover {
-        background: #505050;
-    }
-    """
+        def action_select_none(self) -> None:
+            """Deselect all torrents."""
+            self._selected_hashes.clear()
+            table = self.query_one("#torrent-table", DataTable)
+            with self.batch_update():
+                for i in self._filtered_idx:
+                    table.update_cell(self._torrents[i].hash, self._sel_col_key, "   ")
+            self._update_status()
 
-    BINDINGS = [
-        Binding("q", "quit", "Quit"),
-        Binding("escape", "unfocus_search", "Back"),
-        Binding("space", "toggle_select", "Toggle Select", show=True),
-        Binding("enter", "confirm", "Confirm Selection", show=True, priority=True),
-        Binding("a", "select_all", "Select All"),
-        Binding("n", "select_none", "Select None"),
-        Binding("/", "focus_search", "Search"),
-        Binding("1", "sort_by_name", "Sort Name"),
-        Binding("2", "sort_by_size", "Sort Size"),
-        Binding("3", "sort_by_tracker", "Sort Tracker"),
-    ]
+        def action_focus_search(self) -> None:
+            """Focus the search input."""
+            self.query_one("#search-input", Input).focus()
+
+        def action_unfocus_search(self) -> None:
+            """Unfocus search and return to table, or quit if already on table."""
+            search_input = self.query_one("#search-input", Input)
+            if search_input.has_focus:
+                # Clear search and return to table; the Input.Changed handler
+                # takes care of restoring the full list
+                search_input.value = ""
+                self.query_one("#torrent-table", DataTable).focus()
+            else:
+                self.exit([])
 
-    def __init__(
-        self,
-        torrents: list,
-        config: dict,
-        app_logger: logging.Logger,
-        include_single_episodes: bool,
-    ):
-        super().__init__()
-        self._torrents = torrents
-        self._filtered_torrents = torrents.copy()
-        self._selected_hashes: set = set()
-        self._config = config
-        self._app_logger = app_logger
-        self._include_single_episodes = include_single_episodes
-        self._results: list = []
-        self._sort_column: str | None = None
-        self._sort_reverse: bool = False
-        # Build a map of hash -> torrent for size lookups
-        self._torrent_map: dict = {t.hash: t for t in torrents}
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static("Filter: ", id="search-label"),
-            Input(placeholder="type to filter...", id="search-input"),
-            id="search-container",
-        )
-        yield DataTable(id="torrent-table", cursor_type="row")
-        yield Static(id="status-bar")
-        yield Container(
-            Button("Confirm Selection", id="confirm-btn", variant="primary"),
-            Button("Cancel", id="cancel-btn", variant="error"),
-            id="button-container",
-        )
-        yield Footer()
-
-    def on_mount(self) -> None:
-        """Set up the table when the app starts."""
-        table = self.query_one("#torrent-table", DataTable)
-        # Add sortable columns
-        table.add_column("Sel", key="sel")
-        table.add_column("Name", key="name")
-        table.add_column("Size", key="size")
-        table.add_column("Tracker", key="tracker")
-        self._populate_table()
-        self._update_status()
-        table.focus()
-
-    def _populate_table(self) -> None:
-        """Populate the table with filtered torrents."""
-        table = self.query_one("#torrent-table", DataTable)
-        table.clear()
-
-        for torrent in self._filtered_torrents:
-            size_gb = torrent.size / (1024**3)
-            selected = " * " if torrent.hash in self._selected_hashes else "   "
-            # Extract tracker hostname
-            tracker = torrent.tracker
-            if tracker:
-                # Parse hostname from tracker URL
-                try:
-                    parsed = urlparse(tracker)
-                    tracker = parsed.hostname or tracker
-                except Exception:
-                    pass
+        def _sort_by_column(self, column_key: str) -> None:
+            """Sort by the given column, toggling direction if same column."""
+            # Toggle direction if same column, otherwise reset to ascending
+            if self._sort_column == column_key:
+                self._sort_reverse = not self._sort_reverse
             else:
-                tracker = "-"
-            table.add_row(
-                selected,
-                torrent.name,
-                f"{size_gb:.2f} GB",
-                tracker,
-                key=torrent.hash,
-            )
+                self._sort_column = column_key
+                self._sort_reverse = False
+
+            # Sort the filtered view using the keys cached in __init__
+            if column_key == "name":
+                if not self._sort_reverse and len(self._filtered_idx) == len(
+                    self._torrents
+                ):
+                    # self._torrents is already name-ascending from get_torrents
+                    self._filtered_idx = list(range(len(self._torrents)))
+                else:
+                    self._filtered_idx.sort(
+                        key=lambda i: self._names_casefold[i],
+                        reverse=self._sort_reverse,
+                    )
+            elif column_key == "size":
+                self._filtered_idx.sort(
+                    key=lambda i: self._torrents[i].size, reverse=self._sort_reverse
+                )
+            elif column_key == "tracker":
+                self._filtered_idx.sort(
+                    key=lambda i: self._rows[self._torrents[i].hash].tracker_host,
+                    reverse=self._sort_reverse,
+                )
+            elif column_key == "sel":
+                self._filtered_idx.sort(
+                    key=lambda i: self._torrents[i].hash in self._selected_hashes,
+                    reverse=self._sort_reverse,
+                )
 
-    def _update_status(self) -> None:
-        """Update the status bar."""
-        status = self.query_one("#status-bar", Static)
-        total = len(self._torrents)
-        filtered = len(self._filtered_torrents)
-        selected = len(self._selected_hashes)
-
-        if filtered < total:
-            status.update(f"Showing {filtered}/{total} torrents | {selected} selected")
-        else:
-            status.update(f"{total} torrents | {selected} selected")
-
-    @on(Input.Changed, "#search-input")
-    def filter_torrents(self, event: Input.Changed) -> None:
-        """Filter torrents based on search input."""
-        query = event.value.lower().strip()
-
-        if query:
-            self._filtered_torrents = [
-                t for t in self._torrents if query in t.name.lower()
-            ]
-        else:
-            self._filtered_torrents = self._torrents.copy()
-
-        self._populate_table()
-        self._update_status()
-
-    def action_toggle_select(self) -> None:
-        """Toggle selection of the current row."""
-        table = self.query_one("#torrent-table", DataTable)
-        if table.row_count == 0:
-            return
-
-        row_key = table.coordinate_to_cell_key(table.cursor_coordinate).row_key
-        if row_key is not None:
-            self._toggle_hash(str(row_key.value))
-
-    def _toggle_hash(self, hash_value: str) -> None:
-        """Toggle a hash in the selected set."""
-        if hash_value in self._selected_hashes:
-            self._selected_hashes.discard(hash_value)
-        else:
-            self._selected_hashes.add(hash_value)
-
-        # Update the checkbox in the table
-        table = self.query_one("#torrent-table", DataTable)
-        selected = " * " if hash_value in self._selected_hashes else "   "
-        # Get the first column key from the ordered columns list
-        first_col_key = list(table.columns.keys())[0]
-        table.update_cell(hash_value, first_col_key, selected)
-        self._update_status()
-
-    def action_select_all(self) -> None:
-        """Select all visible torrents."""
-        for torrent in self._filtered_torrents:
-            self._selected_hashes.add(torrent.hash)
-        self._populate_table()
-        self._update_status()
-
-    def action_select_none(self) -> None:
-        """Deselect all torrents."""
-        self._selected_hashes.clear()
-        self._populate_table()
-        self._update_status()
-
-    def action_focus_search(self) -> None:
-        """Focus the search input."""
-        self.query_one("#search-input", Input).focus()
-
-    def action_unfocus_search(self) -> None:
-        """Unfocus search and return to table, or quit if already on table."""
-        search_input = self.query_one("#search-input", Input)
-        if search_input.has_focus:
-            # Clear search and return to table
-            search_input.value = ""
-            self._filtered_torrents = self._torrents.copy()
             self._populate_table()
-            self._update_status()
-            self.query_one("#torrent-table", DataTable).focus()
-        else:
-            self.exit([])
-
-    def _sort_by_column(self, column_key: str) -> None:
-        """Sort by the given column, toggling direction if same column."""
-        # Toggle direction if same column, otherwise reset to ascending
-        if self._sort_column == column_key:
-            self._sort_reverse = not self._sort_reverse
-        else:
-            self._sort_column = column_key
-            self._sort_reverse = False
-
-        # Sort the filtered torrents
-        if column_key == "name":
-            self._filtered_torrents.sort(
-                key=lambda t: t.name.lower(), reverse=self._sort_reverse
-            )
-        elif column_key == "size":
-            self._filtered_torrents.sort(
-                key=lambda t: t.size, reverse=self._sort_reverse
-            )
-        elif column_key == "tracker":
-            self._filtered_torrents.sort(
-                key=lambda t: (t.tracker or "").lower(), reverse=self._sort_reverse
-            )
-        elif column_key == "sel":
-            self._filtered_torrents.sort(
-                key=lambda t: t.hash in self._selected_hashes,
-                reverse=self._sort_reverse,
-            )
 
-        self._populate_table()
+        def action_sort_by_name(self) -> None:
+            """Sort by name column."""
+            self._sort_by_column("name")
 
-    def action_sort_by_name(self) -> None:
-        """Sort by name column."""
-        self._sort_by_column("name")
+        def action_sort_by_size(self) -> None:
+            """Sort by size column."""
+            self._sort_by_column("size")
 
-    def action_sort_by_size(self) -> None:
-        """Sort by size column."""
-        self._sort_by_column("size")
+        def action_sort_by_tracker(self) -> None:
+            """Sort by tracker column."""
+            self._sort_by_column("tracker")
 
-    def action_sort_by_tracker(self) -> None:
-        """Sort by tracker column."""
-        self._sort_by_column("tracker")
+        @on(DataTable.HeaderSelected)
+        def on_header_selected(self, event: DataTable.HeaderSelected) -> None:
+            """Sort table when header is clicked."""
+            self._sort_by_column(str(event.column_key))
 
-    @on(DataTable.HeaderSelected)
-    def on_header_selected(self, event: DataTable.HeaderSelected) -> None:
-        """Sort table when header is clicked."""
-        self._sort_by_column(str(event.column_key))
+        def action_confirm(self) -> None:
+            """Confirm selection and process torrents."""
+            if not self._selected_hashes:
+                self.notify("No torrents selected!", severity="warning")
+                return
 
-    def action_confirm(self) -> None:
-        """Confirm selection and process torrents."""
-        if not self._selected_hashes:
-            self.notify("No torrents selected!", severity="warning")
-            return
+            self._results = list(self._selected_hashes)
+            self.exit(self._results)
 
-        self._results = list(self._selected_hashes)
-        self.exit(self._results)
+        @on(Button.Pressed, "#confirm-btn")
+        def on_confirm_pressed(self) -> None:
+            """Handle confirm button press."""
+            self.action_confirm()
 
-    @on(Button.Pressed, "#confirm-btn")
-    def on_confirm_pressed(self) -> None:
-        """Handle confirm button press."""
-        self.action_confirm()
+        @on(Button.Pressed, "#cancel-btn")
+        def on_cancel_pressed(self) -> None:
+            """Handle cancel button press."""
+            self.exit([])
 
-    @on(Button.Pressed, "#cancel-btn")
-    def on_cancel_pressed(self) -> None:
-        """Handle cancel button press."""
-        self.exit([])
+    return TorrentSelectorApp
 
 
 def run_interactive_mode(
@@ -540,7 +712,8 @@ def run_interactive_mode(
 
     console.print(f"[bold]Found {len(torrents)} torrents. Launching selector...[/bold]")
 
-    app = TorrentSelectorApp(torrents, config, logger, include_single_episodes)
+    app_class = _selector_app_class()
+    app = app_class(torrents, config, logger, include_single_episodes)
     result = app.run()
     return result if result else []
 
@@ -604,14 +777,38 @@ Examples:
     success_count = 0
     fail_count = 0
 
-    for info_hash in info_hashes:
-        console.print(f"  Triggering cross-seed for: [cyan]{info_hash}[/cyan]")
-        if trigger_cross_seed(config, info_hash, logger, include_single_episodes):
-            success_count += 1
-            console.print("    [green]✓ Success[/green]")
-        else:
-            fail_count += 1
-            console.print("    [red]✗ Failed[/red]")
+    session = make_session(len(info_hashes))
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task("Cross-seeding...", total=len(info_hashes))
+        with ThreadPoolExecutor(max_workers=min(16, len(info_hashes))) as executor:
+            futures = {
+                executor.submit(
+                    trigger_cross_seed,
+                    session,
+                    config,
+                    info_hash,
+                    logger,
+                    include_single_episodes,
+                ): info_hash
+                for info_hash in info_hashes
+            }
+            for future in as_completed(futures):
+                info_hash = futures[future]
+                if future.result():
+                    success_count += 1
+                    marker = "[green]✓[/green]"
+                else:
+                    fail_count += 1
+                    marker = "[red]✗[/red]"
+                progress.update(
+                    task, advance=1, description=f"{marker} {info_hash[:10]}"
+                )
 
     # Summary
     console.print("\n[bold]Summary:[/bold]")